@@ -1,66 +1,175 @@
-from lexer import AnalisadorLexico
+from lexer import (
+    AnalisadorLexico, NOMES_TOKENS,
+    T_PROGRAM, T_VAR, T_INT, T_FLOAT, T_BOOL, T_IF, T_ELSE, T_WHILE, T_PRINT, T_TRUE, T_FALSE,
+    T_IDENTIFIER, T_FLOAT_LIT, T_INT_LIT, T_SEMICOLON, T_COLON, T_LBRACE, T_RBRACE,
+    T_LPAREN, T_RPAREN, T_ADD_OP, T_MUL_OP, T_REL_OP, T_ASSIGN,
+)
 
-class Nó:
+# Tipos de token que podem iniciar uma declaração, como máscara de bits indexada pelo tipo.
+PRIMEIROS_DECLARACAO = (1 << T_IDENTIFIER) | (1 << T_IF) | (1 << T_WHILE) | (1 << T_PRINT)
+
+# Tipos de token aceitos como tipo de uma variável na seção de variáveis.
+TIPOS_VARIAVEL = frozenset((T_INT, T_FLOAT, T_BOOL))
+
+# Precedência dos operadores binários; tipos ausentes não são operadores e encerram a expressão.
+PRECEDENCIAS = {T_REL_OP: 1, T_ADD_OP: 2, T_MUL_OP: 3}
+
+# PRECEDENCIAS indexada diretamente pelo tipo do token, com 0 para os tipos que não são operadores.
+PRECEDENCIA_POR_TIPO = tuple(PRECEDENCIAS.get(tipo, 0) for tipo in range(len(NOMES_TOKENS)))
+
+# Recuos pré-calculados usados na representação em string da AST, indexados pelo nível.
+RECUOS = tuple("  " * nivel for nivel in range(128))
+
+class NóBase:
     """
-    Representa um nó em uma árvore sintática abstrata (AST).
-    
+    Representa um nó em uma árvore sintática abstrata (AST), sem definir como os filhos são guardados.
+
+    Os nós concretos são Nó, com no máximo três filhos em campos fixos, e NóLista, com um número variável de filhos.
+
     Atributos:
         tipo (str): O tipo do nó (por exemplo, "EXPR", "DECL_PRINT", "IDENTIFICADOR", etc.).
-        filhos (list): Uma lista de nós filhos, que são as subexpressões ou subdeclarações do nó atual.
         folha: Um valor opcional que contém informações adicionais sobre o nó, como o valor de um número ou o nome de um identificador.
     """
 
-    def __init__(self, _tipo, filhos=None, folha=None):
-        self.tipo = _tipo
-        self.filhos = filhos if filhos is not None else []
-        self.folha = folha
+    __slots__ = ("tipo", "folha")
 
     def __repr__(self, nivel=0):
         """
         Retorna uma representação em string do nó e de seus filhos, com recuo apropriado para mostrar a estrutura hierárquica da árvore.
 
+        A árvore é percorrida em profundidade com uma pilha explícita, e os fragmentos são reunidos com um único join.
+
         Args:
             nivel (int, opcional): O nível de recuo atual. Por padrão, é 0.
 
         Returns:
             str: A representação em string do nó e de seus filhos.
         """
-        recuo = "  " * nivel
-        resultado = f"{recuo}{self.tipo}"
-        if self.folha is not None:
-            resultado += f": {self.folha}"
-        resultado += "\n"
-        for filho in self.filhos:
-            resultado += filho.__repr__(nivel + 1)
-        return resultado
+        partes = []
+        pilha = [(self, nivel)]
+        while pilha:
+            no, nivel_no = pilha.pop()
+            partes.append(RECUOS[nivel_no] if nivel_no < len(RECUOS) else "  " * nivel_no)
+            partes.append(no.tipo)
+            if no.folha is not None:
+                partes.append(": ")
+                partes.append(str(no.folha))
+            partes.append("\n")
+            nivel_filhos = nivel_no + 1
+            if type(no) is NóLista:
+                for filho in reversed(no.filhos):
+                    pilha.append((filho, nivel_filhos))
+            else:
+                if no.c2 is not None:
+                    pilha.append((no.c2, nivel_filhos))
+                if no.c1 is not None:
+                    pilha.append((no.c1, nivel_filhos))
+                if no.c0 is not None:
+                    pilha.append((no.c0, nivel_filhos))
+        return "".join(partes)
+
+class Nó(NóBase):
+    """
+    Representa um nó da AST com no máximo três filhos, guardados em campos fixos.
+
+    Atributos:
+        c0, c1, c2 (NóBase): Os filhos do nó, que são as subexpressões ou subdeclarações do nó atual, ou None quando ausentes.
+    """
+
+    __slots__ = ("c0", "c1", "c2")
+
+    def __init__(self, _tipo, folha=None, c0=None, c1=None, c2=None):
+        self.tipo = _tipo
+        self.folha = folha
+        self.c0 = c0
+        self.c1 = c1
+        self.c2 = c2
+
+    @property
+    def filhos(self):
+        """
+        Retorna os filhos presentes do nó, em ordem.
+
+        Constrói uma nova tupla a cada acesso; o código interno lê c0, c1 e c2 diretamente.
+
+        Returns:
+            tuple: Os filhos do nó que não são None.
+        """
+        return tuple(filho for filho in (self.c0, self.c1, self.c2) if filho is not None)
+
+class NóLista(NóBase):
+    """
+    Representa um nó da AST com um número variável de filhos, como a seção de variáveis e as listas de declarações.
+
+    Atributos:
+        filhos (list): A lista de nós filhos, em ordem.
+    """
+
+    __slots__ = ("filhos",)
+
+    def __init__(self, _tipo, filhos=None, folha=None):
+        self.tipo = _tipo
+        self.folha = folha
+        self.filhos = filhos if filhos is not None else []
     
 class Analisador:
     """
     Representa um analisador sintático que constrói uma árvore sintática abstrata (AST) a partir de uma lista de tokens.
 
+    Os tokens são recebidos como duas sequências paralelas, uma com os tipos e outra com os valores, indexadas pela
+    mesma posição e terminadas por um token T_EOF, como produzidas por AnalisadorLexico.analisar_tokens.
+
+    Cada regra da gramática abaixo corresponde ao método de mesmo nome. Os operadores binários de `expr` associam à
+    esquerda, com a precedência dada por PRECEDENCIAS (MUL_OP > ADD_OP > REL_OP).
+
+        programa    : PROGRAM IDENTIFIER LBRACE secao_var declaracoes RBRACE
+        secao_var   : (VAR IDENTIFIER COLON (INT | FLOAT | BOOL) SEMICOLON)*
+        declaracoes : (atribuicao | decl_if | decl_while | decl_print)*
+        atribuicao  : IDENTIFIER ASSIGN expr SEMICOLON
+        decl_if     : IF LPAREN expr RPAREN LBRACE declaracoes RBRACE (ELSE LBRACE declaracoes RBRACE)?
+        decl_while  : WHILE LPAREN expr RPAREN LBRACE declaracoes RBRACE
+        decl_print  : PRINT LPAREN expr RPAREN SEMICOLON
+        expr        : fator ((REL_OP | ADD_OP | MUL_OP) fator)*
+        fator       : IDENTIFIER | INT_LIT | FLOAT_LIT | TRUE | FALSE | LPAREN expr RPAREN
+
     Atributos:
-        tokens (list): A lista de tokens a serem analisados.
-        token_atual: O token atual sendo analisado.
+        tipos (array): Os tipos (T_*) dos tokens a serem analisados.
+        valores (list): Os valores dos tokens a serem analisados.
+        pos (int): O índice do token atual nas sequências de tokens.
         ast (Nó): A árvore sintática abstrata gerada após a análise.
+        _memo_expr (dict): Expressões já analisadas, indexadas pela posição inicial, ou None se a memorização estiver
+            desativada.
     """
 
-    def __init__(self, tokens):
+    __slots__ = ("tipos", "valores", "pos", "ast", "_memo_expr")
+
+    def __init__(self, tipos, valores, memorizar=False):
         """
         Inicializa um novo objeto Analisador.
 
         Args:
-            tokens (list): A lista de tokens a serem analisados.
+            tipos (array): Os tipos (T_*) dos tokens a serem analisados, terminados por T_EOF.
+            valores (list): Os valores dos tokens, na mesma ordem dos tipos.
+            memorizar (bool, opcional): Se verdadeiro, memoriza o resultado de `expr` para cada posição inicial.
+                Como a gramática atual nunca retrocede, a memorização só é útil para extensões que o façam. Por padrão,
+                é False.
         """
-        self.tokens = tokens
-        self.token_atual = self.tokens.pop(0)
+        self.tipos = tipos
+        self.valores = valores
+        self.pos = 0
         self.ast = None
+        self._memo_expr = {} if memorizar else None
 
     def analisar(self):
         """
         Analisa a lista de tokens e constrói a árvore sintática abstrata (AST).
 
-        A AST gerada pode ser acessada através do atributo `ast` da classe.
+        A AST gerada pode ser acessada através do atributo `ast` da classe. A análise sempre começa do primeiro token,
+        de modo que o mesmo analisador pode ser usado para analisar os tokens mais de uma vez.
         """
+        self.pos = 0
+        if self._memo_expr is not None:
+            self._memo_expr.clear()
         self.ast = self.programa()
 
     def programa(self):
@@ -72,13 +181,13 @@ class Analisador:
         Returns:
             Nó: O nó raiz da AST representando o programa.
         """
-        self.combinar("PROGRAM")
-        identificador = self.combinar("IDENTIFIER")
-        self.combinar("LBRACE")
+        self.combinar(T_PROGRAM)
+        identificador = self.combinar(T_IDENTIFIER)
+        self.combinar(T_LBRACE)
         secao_var = self.secao_var()
         declaracoes = self.declaracoes()
-        self.combinar("RBRACE")
-        return Nó("PROGRAMA", [secao_var, declaracoes], identificador[1])
+        self.combinar(T_RBRACE)
+        return Nó("PROGRAMA", identificador, secao_var, declaracoes)
 
     def secao_var(self):
         """
@@ -87,15 +196,16 @@ class Analisador:
         Returns:
             Nó: Um nó representando a seção de variáveis do programa.
         """
+        tipos = self.tipos
         nos = []
-        while self.token_atual[0] == "VAR":
-            self.combinar("VAR")
-            identificador = self.combinar("IDENTIFIER")
-            self.combinar("COLON")
-            tipo = self.combinar("INT", "FLOAT", "BOOL")
-            self.combinar("SEMICOLON")
-            nos.append(Nó("DECL_VAR", [], (identificador[1], tipo[0])))
-        return Nó("SECAO_VAR", nos)
+        while tipos[self.pos] == T_VAR:
+            self.combinar(T_VAR)
+            identificador = self.combinar(T_IDENTIFIER)
+            self.combinar(T_COLON)
+            tipo = self.combinar_um_de(TIPOS_VARIAVEL)
+            self.combinar(T_SEMICOLON)
+            nos.append(Nó("DECL_VAR", (identificador, NOMES_TOKENS[tipo])))
+        return NóLista("SECAO_VAR", nos)
 
     def declaracoes(self):
         """
@@ -104,17 +214,13 @@ class Analisador:
         Returns:
             Nó: Um nó representando as declarações do programa.
         """
+        tipos = self.tipos
         nos = []
-        while self.token_atual[0] in ("IDENTIFIER", "IF", "WHILE", "PRINT"):
-            if self.token_atual[0] == "IDENTIFIER":
-                nos.append(self.atribuicao())
-            elif self.token_atual[0] == "IF":
-                nos.append(self.decl_if())
-            elif self.token_atual[0] == "WHILE":
-                nos.append(self.decl_while())
-            elif self.token_atual[0] == "PRINT":
-                nos.append(self.decl_print())
-        return Nó("DECLARACOES", nos)
+        tipo = tipos[self.pos]
+        while (1 << tipo) & PRIMEIROS_DECLARACAO:
+            nos.append(METODOS_DECLARACAO[tipo](self))
+            tipo = tipos[self.pos]
+        return NóLista("DECLARACOES", nos)
 
     def atribuicao(self):
         """
@@ -123,11 +229,11 @@ class Analisador:
         Returns:
             Nó: Um nó representando a atribuição de variável.
         """
-        identificador = self.combinar("IDENTIFIER")
-        self.combinar("ASSIGN")
+        identificador = self.combinar(T_IDENTIFIER)
+        self.combinar(T_ASSIGN)
         expr = self.expr()
-        self.combinar("SEMICOLON")
-        return Nó("ATRIBUICAO", [expr], identificador[1])
+        self.combinar(T_SEMICOLON)
+        return Nó("ATRIBUICAO", identificador, expr)
 
     def decl_if(self):
         """
@@ -136,20 +242,20 @@ class Analisador:
         Returns:
             Nó: Um nó representando a declaração if.
         """
-        self.combinar("IF")
-        self.combinar("LPAREN")
+        self.combinar(T_IF)
+        self.combinar(T_LPAREN)
         condicao = self.expr()
-        self.combinar("RPAREN")
-        self.combinar("LBRACE")
+        self.combinar(T_RPAREN)
+        self.combinar(T_LBRACE)
         declaracoes_verdadeiras = self.declaracoes()
-        self.combinar("RBRACE")
+        self.combinar(T_RBRACE)
         declaracoes_falsas = None
-        if self.token_atual[0] == "ELSE":
-            self.combinar("ELSE")
-            self.combinar("LBRACE")
+        if self._tipo_atual() == T_ELSE:
+            self.combinar(T_ELSE)
+            self.combinar(T_LBRACE)
             declaracoes_falsas = self.declaracoes()
-            self.combinar("RBRACE")
-        return Nó("DECL_IF", [condicao, declaracoes_verdadeiras, declaracoes_falsas])
+            self.combinar(T_RBRACE)
+        return Nó("DECL_IF", None, condicao, declaracoes_verdadeiras, declaracoes_falsas)
 
     def decl_while(self):
         """
@@ -158,14 +264,14 @@ class Analisador:
         Returns:
             Nó: Um nó representando a declaração while.
         """
-        self.combinar("WHILE")
-        self.combinar("LPAREN")
+        self.combinar(T_WHILE)
+        self.combinar(T_LPAREN)
         condicao = self.expr()
-        self.combinar("RPAREN")
-        self.combinar("LBRACE")
+        self.combinar(T_RPAREN)
+        self.combinar(T_LBRACE)
         declaracoes_loop = self.declaracoes()
-        self.combinar("RBRACE")
-        return Nó("DECL_WHILE", [condicao, declaracoes_loop])
+        self.combinar(T_RBRACE)
+        return Nó("DECL_WHILE", None, condicao, declaracoes_loop)
 
     def decl_print(self):
         """
@@ -174,54 +280,59 @@ class Analisador:
         Returns:
             Nó: Um nó representando a declaração print.
         """
-        self.combinar("PRINT")
-        self.combinar("LPAREN")
+        self.combinar(T_PRINT)
+        self.combinar(T_LPAREN)
         expr = self.expr()
-        self.combinar("RPAREN")
-        self.combinar("SEMICOLON")
-        return Nó("DECL_PRINT", [expr])
+        self.combinar(T_RPAREN)
+        self.combinar(T_SEMICOLON)
+        return Nó("DECL_PRINT", None, expr)
 
     def expr(self):
         """
         Analisa uma expressão e retorna um nó representando essa expressão.
 
+        Se a memorização estiver ativada, uma expressão que já foi analisada a partir da posição atual é retornada
+        diretamente, e a posição avança para o fim dela.
+
         Returns:
             Nó: Um nó representando a expressão.
         """
-        esquerda = self.expr_simples()
-        while self.token_atual[0] == "REL_OP":
-            op = self.combinar("REL_OP")
-            direita = self.expr_simples()
-            esquerda = Nó("EXPR", [esquerda, direita], op[1])
-        return esquerda
-
-    def expr_simples(self):
+        memo = self._memo_expr
+        if memo is None:
+            return self._expr_precedencia(1)
+        inicio = self.pos
+        memorizado = memo.get(inicio)
+        if memorizado is not None:
+            self.pos = memorizado[1]
+            return memorizado[0]
+        no = self._expr_precedencia(1)
+        memo[inicio] = (no, self.pos)
+        return no
+
+    def _expr_precedencia(self, precedencia_minima):
         """
-        Analisa uma expressão simples e retorna um nó representando essa expressão.
+        Analisa uma expressão cujos operadores tenham precedência maior ou igual a `precedencia_minima`.
 
-        Returns:
-            Nó: Um nó representando a expressão simples.
-        """
-        esquerda = self.termo()
-        while self.token_atual[0] == "ADD_OP":
-            op = self.combinar("ADD_OP")
-            direita = self.termo()
-            esquerda = Nó("EXPR", [esquerda, direita], op[1])
-        return esquerda
+        Os níveis de precedência dos operadores são dados por PRECEDENCIAS, consultada através da tabela
+        PRECEDENCIA_POR_TIPO, e todos os operadores associam à esquerda. Um fator sem operadores é analisado com uma
+        única chamada, sem passar por um método para cada nível.
 
-    def termo(self):
-        """
-        Analisa um termo e retorna um nó representando esse termo.
+        Args:
+            precedencia_minima (int): A menor precedência de operador aceita neste nível.
 
         Returns:
-            Nó: Um nó representando o termo.
+            Nó: Um nó representando a expressão.
         """
+        tipos = self.tipos
         esquerda = self.fator()
-        while self.token_atual[0] == "MUL_OP":
-            op = self.combinar("MUL_OP")
-            direita = self.fator()
-            esquerda = Nó("EXPR", [esquerda, direita], op[1])
-        return esquerda
+        while True:
+            precedencia = PRECEDENCIA_POR_TIPO[tipos[self.pos]]
+            if precedencia < precedencia_minima:
+                return esquerda
+            op = self.valores[self.pos]
+            self.pos += 1
+            direita = self._expr_precedencia(precedencia + 1)
+            esquerda = Nó("EXPR", op, esquerda, direita)
 
     def fator(self):
         """
@@ -229,81 +340,136 @@ class Analisador:
 
         Returns:
             Nó: Um nó representando o fator.
+
+        Raises:
+            SyntaxError: Se o token atual não puder iniciar um fator.
         """
-        if self.token_atual[0] == "IDENTIFIER":
-            return Nó("IDENTIFICADOR", [], self.combinar("IDENTIFIER")[1])
-        elif self.token_atual[0] == "NUMBER":
-            return Nó("NUMERO", [], self.combinar("NUMBER")[1])
-        elif self.token_atual[0] == "LPAREN":
-            self.combinar("LPAREN")
+        tipo = self.tipos[self.pos]
+        if tipo == T_IDENTIFIER:
+            return Nó("IDENTIFICADOR", self.combinar(T_IDENTIFIER))
+        elif tipo == T_INT_LIT:
+            return Nó("NUMERO", self.combinar(T_INT_LIT))
+        elif tipo == T_FLOAT_LIT:
+            return Nó("NUMERO", self.combinar(T_FLOAT_LIT))
+        elif tipo == T_LPAREN:
+            self.combinar(T_LPAREN)
             expr = self.expr()
-            self.combinar("RPAREN")
+            self.combinar(T_RPAREN)
             return expr
-        elif self.token_atual[0] == "TRUE":
-            return Nó("BOOLEANO", [], self.combinar("TRUE")[1])
-        elif self.token_atual[0] == "FALSE":
-            return Nó("BOOLEANO", [], self.combinar("FALSE")[1])
+        elif tipo == T_TRUE:
+            return Nó("BOOLEANO", self.combinar(T_TRUE))
+        elif tipo == T_FALSE:
+            return Nó("BOOLEANO", self.combinar(T_FALSE))
+        raise self._erro_token_inesperado()
+
+    def combinar(self, tipo_esperado):
+        """
+        Verifica se o token atual é do tipo esperado e avança para o próximo token.
+
+        Args:
+            tipo_esperado (int): O tipo de token esperado.
 
-    def combinar(self, *tipos_esperados):
+        Returns:
+            str: O valor do token atual, se corresponder ao tipo esperado.
+
+        Raises:
+            SyntaxError: Se o token atual não for do tipo esperado.
+        """
+        if self._tipo_atual() == tipo_esperado:
+            self.pos += 1
+            return self.valores[self.pos - 1]
+        else:
+            raise self._erro_token_inesperado()
+
+    def combinar_um_de(self, tipos_esperados):
         """
         Verifica se o token atual corresponde a um dos tipos esperados e avança para o próximo token.
 
         Args:
-            *tipos_esperados: Um ou mais tipos de token esperados.
+            tipos_esperados (frozenset): O conjunto de tipos de token aceitos.
 
         Returns:
-            tuple: O token atual, se corresponder a um dos tipos esperados.
+            int: O tipo do token atual, se corresponder a um dos tipos esperados.
 
         Raises:
             SyntaxError: Se o token atual não corresponder a nenhum dos tipos esperados.
         """
-        if self.token_atual[0] in tipos_esperados:
-            token = self.token_atual
-            self.token_atual = self.tokens.pop(0) if self.tokens else None
-            return token
+        tipo = self._tipo_atual()
+        if tipo in tipos_esperados:
+            self.pos += 1
+            return tipo
         else:
-            raise SyntaxError(f"Token inesperado: {self.token_atual}")
-        
-codigo_fonte = """programa teste
-{
-    var x : int;
-    var y : float;
-    var z : bool;
-    x = 10;
-    y = 3.14;
-    z = true;
-    
-    if (x > 5) {
-        print(x);
-    } else {
-        print(x - 1);
-    }
+            raise self._erro_token_inesperado()
+
+    def _tipo_atual(self):
+        """
+        Retorna o tipo do token atual sem consumi-lo.
 
-    while (x > 0) {
-        x = x - 1;
-        print(x);
-    }
+        Como o token T_EOF nunca é consumido, a posição atual nunca ultrapassa o fim das sequências.
 
-    if (z) {
-        print("TRUE");
-    } else {
-        print("FALSE");
-    }
-}"""
+        Returns:
+            int: O tipo do token na posição atual.
+        """
+        return self.tipos[self.pos]
 
+    def _erro_token_inesperado(self):
+        """
+        Constrói o erro de sintaxe para o token atual.
 
-"""
-Uso do analisador léxico e do analisador para analisar o código-fonte de um programa.
+        Returns:
+            SyntaxError: O erro descrevendo o tipo e o valor do token encontrado.
+        """
+        return SyntaxError(f"Token inesperado: {(NOMES_TOKENS[self._tipo_atual()], self.valores[self.pos])}")
+
+# Método que analisa a declaração iniciada por cada tipo de token de PRIMEIROS_DECLARACAO.
+METODOS_DECLARACAO = {
+    T_IDENTIFIER: Analisador.atribuicao,
+    T_IF: Analisador.decl_if,
+    T_WHILE: Analisador.decl_while,
+    T_PRINT: Analisador.decl_print,
+}
+
+if __name__ == "__main__":
+    codigo_fonte = """programa teste
+    {
+        var x : int;
+        var y : float;
+        var z : bool;
+        x = 10;
+        y = 3.14;
+        z = true;
+
+        if (x > 5) {
+            print(x);
+        } else {
+            print(x - 1);
+        }
+
+        while (x > 0) {
+            x = x - 1;
+            print(x);
+        }
+
+        if (z) {
+            print("TRUE");
+        } else {
+            print("FALSE");
+        }
+    }"""
 
-O código-fonte é analisado pelo analisador léxico para produzir uma lista de tokens. Em seguida, o analisador é usado
-para analisar a lista de tokens e construir uma árvore sintática abstrata (AST).
 
-A AST é então impressa para mostrar a estrutura do programa.
-"""
+    """
+    Uso do analisador léxico e do analisador para analisar o código-fonte de um programa.
+
+    O código-fonte é analisado pelo analisador léxico para produzir uma lista de tokens. Em seguida, o analisador é usado
+    para analisar a lista de tokens e construir uma árvore sintática abstrata (AST).
+
+    A AST é então impressa para mostrar a estrutura do programa.
+    """
 
-analisador_lexico = AnalisadorLexico(codigo_fonte)
-tokens = analisador_lexico.analisar_tokens()
-analisador = Analisador(tokens)
-analisador.analisar()
+    analisador_lexico = AnalisadorLexico(codigo_fonte)
+    tipos, valores = analisador_lexico.analisar_tokens()
+    analisador = Analisador(tipos, valores)
+    analisador.analisar()
 
-print(analisador.ast)
\ No newline at end of file
+    print(analisador.ast)
@@ -1,59 +1,169 @@
-import re
+from array import array
+
+NOMES_TOKENS = (
+    "PROGRAM", "VAR", "INT", "FLOAT", "BOOL", "IF", "ELSE", "WHILE", "PRINT", "TRUE", "FALSE",
+    "IDENTIFIER", "FLOAT_LIT", "INT_LIT", "SEMICOLON", "COLON", "LBRACE", "RBRACE", "MULTILINE_COMMENT",
+    "LPAREN", "RPAREN", "ADD_OP", "MUL_OP", "REL_OP", "ASSIGN", "EOF",
+)
+
+"""
+Os tipos de token são representados por inteiros pequenos, de modo que as comparações feitas pelo analisador
+sintático sejam comparações de inteiros. O nome de cada tipo pode ser obtido em NOMES_TOKENS[tipo].
+"""
+(
+    T_PROGRAM, T_VAR, T_INT, T_FLOAT, T_BOOL, T_IF, T_ELSE, T_WHILE, T_PRINT, T_TRUE, T_FALSE,
+    T_IDENTIFIER, T_FLOAT_LIT, T_INT_LIT, T_SEMICOLON, T_COLON, T_LBRACE, T_RBRACE, T_MULTILINE_COMMENT,
+    T_LPAREN, T_RPAREN, T_ADD_OP, T_MUL_OP, T_REL_OP, T_ASSIGN, T_EOF,
+) = range(len(NOMES_TOKENS))
+
+PALAVRAS_RESERVADAS = {
+    "programa": T_PROGRAM,
+    "var": T_VAR,
+    "int": T_INT,
+    "float": T_FLOAT,
+    "bool": T_BOOL,
+    "if": T_IF,
+    "else": T_ELSE,
+    "while": T_WHILE,
+    "print": T_PRINT,
+    "true": T_TRUE,
+    "false": T_FALSE,
+}
+
+SIMBOLOS = {
+    ";": T_SEMICOLON,
+    ":": T_COLON,
+    "{": T_LBRACE,
+    "}": T_RBRACE,
+    "(": T_LPAREN,
+    ")": T_RPAREN,
+    "+": T_ADD_OP,
+    "-": T_ADD_OP,
+    "*": T_MUL_OP,
+    "/": T_MUL_OP,
+    "<": T_REL_OP,
+    ">": T_REL_OP,
+    "=": T_ASSIGN,
+}
+
+SIMBOLOS_DUPLOS = {
+    "<=": T_REL_OP,
+    ">=": T_REL_OP,
+    "==": T_REL_OP,
+    "!=": T_REL_OP,
+}
+
+def _caractere_de_palavra(c):
+    """
+    Indica se o caractere pode fazer parte de uma palavra (letra, dígito ou sublinhado).
+    """
+    return c.isalnum() or c == "_"
 
 class AnalisadorLexico:
     def __init__(self, codigo_fonte):
         self.codigo_fonte = codigo_fonte
-        self.tokens = []
+        self.tipos = array("i")
+        self.valores = []
 
     def analisar_tokens(self):
-        especificacoes_tokens = [
-            ("PROGRAM", r"\bprograma\b"),
-            ("VAR", r"\bvar\b"),
-            ("INT", r"\bint\b"),
-            ("FLOAT", r"\bfloat\b"),
-            ("BOOL", r"\bbool\b"),
-            ("IF", r"\bif\b"),
-            ("ELSE", r"\belse\b"),
-            ("WHILE", r"\bwhile\b"),
-            ("PRINT", r"\bprint\b"),
-            ("TRUE", r"\btrue\b"),
-            ("FALSE", r"\bfalse\b"),
-            ("IDENTIFIER", r"\b[a-zA-Z_][a-zA-Z0-9_]*\b"),
-            ("NUMBER", r"\b\d+(\.\d*)?\b"),
-            ("SEMICOLON", r";"),
-            ("COLON", r":"),
-            ("LBRACE", r"\{"),
-            ("RBRACE", r"\}"),
-            ("MULTILINE_COMMENT", r"/\*.*?\*/"),
-            ("LPAREN", r"\("),
-            ("RPAREN", r"\)"),
-            ("ADD_OP", r"[+-]"),
-            ("MUL_OP", r"[\*/]"),
-            ("REL_OP", r"[<>]=?|==|!="),
-            ("ASSIGN", r"="),
-            ("WHITESPACE", r"\s+"),
-        ]
-        
+        """
+        O código percorre o código-fonte caractere a caractere, decidindo o tipo de cada token pelo seu primeiro caractere.
 
+        Palavras (sequências de letras, dígitos e sublinhados) são classificadas como palavras reservadas, identificadores
+        ou literais numéricos; palavras que não formam nenhum desses tokens são descartadas. Símbolos são classificados
+        pelas tabelas SIMBOLOS_DUPLOS e SIMBOLOS, e comentários /* ... */ de uma única linha são emitidos como tokens
+        MULTILINE_COMMENT. Espaços em branco e caracteres não reconhecidos são ignorados.
+
+        O tipo de cada token (um dos inteiros T_*) é escrito no array `tipos` e o valor é escrito, na mesma posição, na
+        lista `valores`. Como cada token contém ao menos um caractere que não é espaço, tabulação ou quebra de linha,
+        as duas sequências são alocadas de uma vez com esse limite (mais um, para o T_EOF) e truncadas ao número de
+        tokens encontrados ao final. As sequências são terminadas por um token T_EOF, de modo que o analisador
+        sintático pode consultar o tipo do token atual sem verificar o fim da entrada.
+
+        Ao final, as duas sequências paralelas são retornadas.
+        """
+        codigo = self.codigo_fonte
+        n = len(codigo)
+        capacidade = n - codigo.count(" ") - codigo.count("\n") - codigo.count("\t") + 1
+        tipos = array("i", [0]) * capacidade
+        valores = [None] * capacidade
+        quantidade = 0
+        i = 0
+        while i < n:
+            c = codigo[i]
+            if c.isspace():
+                i += 1
+            elif _caractere_de_palavra(c):
+                j = i + 1
+                while j < n and _caractere_de_palavra(codigo[j]):
+                    j += 1
+                palavra = codigo[i:j]
+                if palavra.isdecimal():
+                    tipo = T_INT_LIT
+                    # Um ponto seguido de outra palavra forma um literal real; a parte fracionária só é incluída
+                    # se for formada apenas por dígitos.
+                    if j + 1 < n and codigo[j] == "." and _caractere_de_palavra(codigo[j + 1]):
+                        tipo = T_FLOAT_LIT
+                        k = j + 1
+                        while k < n and codigo[k].isdecimal():
+                            k += 1
+                        j = k if k == n or not _caractere_de_palavra(codigo[k]) else j + 1
+                    tipos[quantidade] = tipo
+                    valores[quantidade] = codigo[i:j]
+                    quantidade += 1
+                elif palavra.isascii() and palavra.isidentifier():
+                    tipos[quantidade] = PALAVRAS_RESERVADAS.get(palavra, T_IDENTIFIER)
+                    valores[quantidade] = palavra
+                    quantidade += 1
+                i = j
+            else:
+                fim_comentario = self._fim_comentario(i) if codigo.startswith("/*", i) else -1
+                par = codigo[i:i + 2]
+                if fim_comentario != -1:
+                    tipos[quantidade] = T_MULTILINE_COMMENT
+                    valores[quantidade] = codigo[i:fim_comentario]
+                    quantidade += 1
+                    i = fim_comentario
+                elif par in SIMBOLOS_DUPLOS:
+                    tipos[quantidade] = SIMBOLOS_DUPLOS[par]
+                    valores[quantidade] = par
+                    quantidade += 1
+                    i += 2
+                else:
+                    tipo = SIMBOLOS.get(c)
+                    if tipo is not None:
+                        tipos[quantidade] = tipo
+                        valores[quantidade] = c
+                        quantidade += 1
+                    i += 1
+        tipos[quantidade] = T_EOF
+        valores[quantidade] = ""
+        del tipos[quantidade + 1:]
+        del valores[quantidade + 1:]
+        self.tipos = tipos
+        self.valores = valores
+
+        return tipos, valores
+
+    def _fim_comentario(self, inicio):
         """
-        O código constrói uma expressão regular a partir das especificações de tokens e utiliza a biblioteca 're'
-        para encontrar todas as correspondências no código-fonte.
+        Procura o fim de um comentário que começa com "/*" na posição `inicio`.
 
-        Cada correspondência é verificada para determinar o tipo e o valor do token. Os tokens de espaço em branco são ignorados,
-        enquanto os demais tokens são adicionados à lista de tokens.
+        Args:
+            inicio (int): A posição da barra que abre o comentário.
 
-        Ao final, a lista de tokens é retornada.
+        Returns:
+            int: A posição logo após o "*/" que fecha o comentário, ou -1 se ele não for fechado na mesma linha.
         """
-        regex = "|".join(f"(?P<{nome}>{padrao})" for nome, padrao in especificacoes_tokens)
-        for correspondencia in re.finditer(regex, self.codigo_fonte):
-            tipo_token = correspondencia.lastgroup
-            valor_token = correspondencia.group(tipo_token)
-            if tipo_token != "WHITESPACE":
-                self.tokens.append((tipo_token, valor_token))
-
-        return self.tokens
-
-codigo_fonte = "var x:int; x=10; se (x == 10) { imprimir(x); }"
-analisador_lexico = AnalisadorLexico(codigo_fonte)
-tokens = analisador_lexico.analisar_tokens()
-print(tokens)
\ No newline at end of file
+        codigo = self.codigo_fonte
+        fim_linha = codigo.find("\n", inicio + 2)
+        fim = codigo.find("*/", inicio + 2, fim_linha if fim_linha != -1 else len(codigo))
+        if fim == -1:
+            return -1
+        return fim + 2
+
+if __name__ == "__main__":
+    codigo_fonte = "var x:int; x=10; se (x == 10) { imprimir(x); }"
+    analisador_lexico = AnalisadorLexico(codigo_fonte)
+    tipos, valores = analisador_lexico.analisar_tokens()
+    print([(NOMES_TOKENS[tipo], valor) for tipo, valor in zip(tipos, valores)])
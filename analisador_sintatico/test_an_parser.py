@@ -0,0 +1,89 @@
+import unittest
+
+from an_parser import Analisador, Nó
+from lexer import AnalisadorLexico
+
+PROGRAMA_EXEMPLO = """programa teste
+{
+    var x : int;
+    var y : float;
+    x = (10 + x) * 2 - 3 / y < 4 == true;
+    if (x > 5) { print(x); } else { print(x - 1); }
+    while (x > 0) { x = x - 1; if (x) { y = 2.5; } }
+}"""
+
+
+def analisador(codigo_fonte, **opcoes):
+    """
+    Retorna um analisador já executado sobre o código-fonte.
+    """
+    resultado = Analisador(*AnalisadorLexico(codigo_fonte).analisar_tokens(), **opcoes)
+    resultado.analisar()
+    return resultado
+
+
+def expressao(texto):
+    """
+    Retorna a AST da expressão, analisada como o lado direito de uma atribuição.
+    """
+    ast = analisador(f"programa p {{ x = {texto}; }}").ast
+    return ast.c1.filhos[0].c0
+
+
+def op(operador, esquerda, direita):
+    return Nó("EXPR", operador, esquerda, direita)
+
+
+def ident(nome):
+    return Nó("IDENTIFICADOR", nome)
+
+
+def num(valor):
+    return Nó("NUMERO", valor)
+
+
+class TestAnalisador(unittest.TestCase):
+    def assertMesmaArvore(self, obtida, esperada):
+        self.assertEqual(repr(obtida), repr(esperada))
+
+    def test_precedencia_dos_operadores(self):
+        self.assertMesmaArvore(expressao("1 + 2 * 3"), op("+", num("1"), op("*", num("2"), num("3"))))
+        self.assertMesmaArvore(
+            expressao("a < b + c * d"),
+            op("<", ident("a"), op("+", ident("b"), op("*", ident("c"), ident("d")))),
+        )
+        self.assertMesmaArvore(
+            expressao("a * b + c < d"),
+            op("<", op("+", op("*", ident("a"), ident("b")), ident("c")), ident("d")),
+        )
+
+    def test_associatividade_a_esquerda(self):
+        self.assertMesmaArvore(expressao("a - b - c"), op("-", op("-", ident("a"), ident("b")), ident("c")))
+        self.assertMesmaArvore(expressao("a / b * c"), op("*", op("/", ident("a"), ident("b")), ident("c")))
+        self.assertMesmaArvore(expressao("a < b == c"), op("==", op("<", ident("a"), ident("b")), ident("c")))
+
+    def test_parenteses(self):
+        self.assertMesmaArvore(expressao("(1 + 2) * 3"), op("*", op("+", num("1"), num("2")), num("3")))
+        self.assertMesmaArvore(expressao("a - (b - c)"), op("-", ident("a"), op("-", ident("b"), ident("c"))))
+
+    def test_nova_analise_produz_a_mesma_arvore(self):
+        resultado = analisador(PROGRAMA_EXEMPLO)
+        primeira = repr(resultado.ast)
+        resultado.analisar()
+        self.assertEqual(repr(resultado.ast), primeira)
+
+    def test_memorizacao_produz_a_mesma_arvore(self):
+        com_memo = analisador(PROGRAMA_EXEMPLO, memorizar=True)
+        self.assertEqual(repr(com_memo.ast), repr(analisador(PROGRAMA_EXEMPLO).ast))
+        com_memo.analisar()
+        self.assertEqual(repr(com_memo.ast), repr(analisador(PROGRAMA_EXEMPLO).ast))
+
+    def test_fator_ausente(self):
+        with self.assertRaises(SyntaxError):
+            analisador("programa p { x = ; }")
+        with self.assertRaises(SyntaxError):
+            analisador("programa p { print(1 + ); }")
+
+
+if __name__ == "__main__":
+    unittest.main()
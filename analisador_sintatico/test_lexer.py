@@ -0,0 +1,102 @@
+import random
+import re
+import unittest
+
+from lexer import AnalisadorLexico, NOMES_TOKENS
+
+"""
+Especificação de referência: a expressão regular usada pelo analisador léxico antes da troca pelo percorrimento
+caractere a caractere. O analisador atual deve produzir exatamente os mesmos tokens que ela.
+"""
+ESPECIFICACOES_REFERENCIA = [
+    ("PROGRAM", r"\bprograma\b"),
+    ("VAR", r"\bvar\b"),
+    ("INT", r"\bint\b"),
+    ("FLOAT", r"\bfloat\b"),
+    ("BOOL", r"\bbool\b"),
+    ("IF", r"\bif\b"),
+    ("ELSE", r"\belse\b"),
+    ("WHILE", r"\bwhile\b"),
+    ("PRINT", r"\bprint\b"),
+    ("TRUE", r"\btrue\b"),
+    ("FALSE", r"\bfalse\b"),
+    ("IDENTIFIER", r"\b[a-zA-Z_][a-zA-Z0-9_]*\b"),
+    ("FLOAT_LIT", r"\b\d+\.\d*\b"),
+    ("INT_LIT", r"\b\d+\b"),
+    ("SEMICOLON", r";"),
+    ("COLON", r":"),
+    ("LBRACE", r"\{"),
+    ("RBRACE", r"\}"),
+    ("MULTILINE_COMMENT", r"/\*.*?\*/"),
+    ("LPAREN", r"\("),
+    ("RPAREN", r"\)"),
+    ("ADD_OP", r"[+-]"),
+    ("MUL_OP", r"[\*/]"),
+    ("REL_OP", r"[<>]=?|==|!="),
+    ("ASSIGN", r"="),
+    ("WHITESPACE", r"\s+"),
+]
+REGEX_REFERENCIA = re.compile("|".join(f"(?P<{nome}>{padrao})" for nome, padrao in ESPECIFICACOES_REFERENCIA))
+
+
+def tokens(codigo_fonte):
+    """
+    Retorna os tokens do código-fonte como pares (nome, valor), sem o token EOF final.
+    """
+    tipos, valores = AnalisadorLexico(codigo_fonte).analisar_tokens()
+    return [(NOMES_TOKENS[tipo], valor) for tipo, valor in zip(tipos, valores)][:-1]
+
+
+def tokens_referencia(codigo_fonte):
+    """
+    Retorna os tokens do código-fonte segundo a expressão regular de referência, como pares (nome, valor).
+    """
+    return [
+        (correspondencia.lastgroup, correspondencia.group())
+        for correspondencia in REGEX_REFERENCIA.finditer(codigo_fonte)
+        if correspondencia.lastgroup != "WHITESPACE"
+    ]
+
+
+class TestAnalisadorLexico(unittest.TestCase):
+    def test_literais_numericos(self):
+        self.assertEqual(tokens("1."), [("INT_LIT", "1")])
+        self.assertEqual(tokens("1. x"), [("INT_LIT", "1"), ("IDENTIFIER", "x")])
+        self.assertEqual(tokens("1.a"), [("FLOAT_LIT", "1."), ("IDENTIFIER", "a")])
+        self.assertEqual(tokens("1.5.3"), [("FLOAT_LIT", "1.5"), ("INT_LIT", "3")])
+        self.assertEqual(tokens("3.14abc"), [("FLOAT_LIT", "3.")])
+        self.assertEqual(tokens("3.14"), [("FLOAT_LIT", "3.14")])
+
+    def test_palavras_nao_ascii_sao_descartadas(self):
+        self.assertEqual(tokens("é aé ab1"), [("IDENTIFIER", "ab1")])
+
+    def test_operadores_relacionais(self):
+        self.assertEqual(
+            tokens("a == b != c <= d = e !"),
+            [
+                ("IDENTIFIER", "a"), ("REL_OP", "=="), ("IDENTIFIER", "b"), ("REL_OP", "!="),
+                ("IDENTIFIER", "c"), ("REL_OP", "<="), ("IDENTIFIER", "d"), ("ASSIGN", "="), ("IDENTIFIER", "e"),
+            ],
+        )
+
+    def test_comentarios(self):
+        self.assertEqual(tokens("/* c */ x"), [("MULTILINE_COMMENT", "/* c */"), ("IDENTIFIER", "x")])
+        self.assertEqual(
+            tokens("/* c\n */ x"),
+            [("MUL_OP", "/"), ("MUL_OP", "*"), ("IDENTIFIER", "c"), ("MUL_OP", "*"), ("MUL_OP", "/"), ("IDENTIFIER", "x")],
+        )
+        self.assertEqual(
+            tokens("/* a */ /* b\n"),
+            [("MULTILINE_COMMENT", "/* a */"), ("MUL_OP", "/"), ("MUL_OP", "*"), ("IDENTIFIER", "b")],
+        )
+
+    def test_equivalencia_com_expressao_regular(self):
+        gerador = random.Random(0)
+        alfabeto = "ab1_ .;:{}()+-*/<>=!\n\t\"é3²٣Z9"
+        for _ in range(2000):
+            codigo_fonte = "".join(gerador.choice(alfabeto) for _ in range(gerador.randint(0, 30)))
+            self.assertEqual(tokens(codigo_fonte), tokens_referencia(codigo_fonte), repr(codigo_fonte))
+
+
+if __name__ == "__main__":
+    unittest.main()